@@ -17,12 +17,9 @@ from .services.drawing_service import DrawingService
 from .services.zipping_service import ZippingService
 from .services.export_service import ExportService
 from .services.copy_service import CopyService
-
-# from .services.zipping_service import ZippingService
 from .objects.app_context import AppContext
 from .objects.config import Config
 from .utilities.logging_utility import Logger
-from .services.interactive_selection_service import InteractiveSelectionService
 
 
 def flush_buffers(ctx: AppContext, config: Config):
@@ -65,6 +62,11 @@ def main() -> None:
     # Handles for --version, --config-user, --no-config
     GeneralOptionsService.handle_args(ctx, config)
 
+    # Nothing else to run if a general option was handled
+    if config.version or config.config_user:
+        flush_buffers(ctx, config)
+        return
+
 
     # This service returns all the items to include resolved in a dict
     # Hover over ItemsSelectionService to check the format which it returns
@@ -73,7 +75,10 @@ def main() -> None:
 
     # Select files interactively if requested
     # NOTE: this one is currently broken
+    # NOTE: imported here, since prompt_toolkit is slow to import and is not
+    # needed by any other mode
     if config.interactive:
+        from .services.interactive_selection_service import InteractiveSelectionService
         resolved_root = InteractiveSelectionService.run(ctx, config, resolved_root)
 
 
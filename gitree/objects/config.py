@@ -22,14 +22,26 @@ class Config:
         """
         self.defaults: dict[str, Any] = self._build_default_config()
         self.global_cfg: dict[str, Any] = {}
-        self.user_cfg: dict[str, Any] = self._build_user_config()
+        self.user_cfg: dict[str, Any] = {}
         self.cli: dict[str, Any] = vars(args)
 
 
         # Disable user- and global-level configuration if --no-config is used
-        if hasattr(args, "no_config"):
-            self.user_cfg = {}
-            self.global_cfg = {}
+        # NOTE: the user config file is then not even read
+        if not hasattr(args, "no_config"):
+            self.user_cfg = self._build_user_config()
+
+
+        # Merge the configs once (later dicts take precedence), and expose
+        # the known keys as real attributes so reads skip __getattr__
+        # NOTE: only keys of the defaults and the CLI (argparse dests), never
+        # arbitrary ones from config.json (e.g. "__class__" or "_get"), those
+        # are left to __getattr__
+        self._merged: dict[str, Any] = {
+            **self.defaults, **self.global_cfg, **self.user_cfg, **self.cli}
+        for key in self.defaults.keys() | self.cli.keys():
+            if key not in self.__dict__:    # Never shadow the config dicts themselves
+                setattr(self, key, self._merged[key])
 
 
     def _build_user_config(self) -> dict[str, Any]:
@@ -55,23 +67,19 @@ class Config:
         Precedence: CLI > user > global > defaults > fallback default
         """
 
-        if key in self.cli:
-            return self.cli[key]
-        if key in self.user_cfg:
-            return self.user_cfg[key]
-        if key in self.global_cfg:
-            return self.global_cfg[key]
-        if key in self.defaults:
-            return self.defaults[key]
-        
-        raise KeyError      # If key was not in any of the dicts
+        return self._merged[key]      # Raises KeyError if key was not in any of the dicts
 
 
     def __getattr__(self, name: str) -> Any:
         """
         Allow attribute-style access:
         cfg.max_items converted to cfg.get("max_items")
+
+        NOTE: only reached for keys missing from the merged config, since
+        every merged key is also set as an instance attribute
         """
+        if name.startswith("_"):        # Avoid recursion before _merged is set
+            raise AttributeError(f"'Config' object has no attribute '{name}'")
         try:
             return self._get(name)
         except KeyError:
@@ -96,6 +104,8 @@ class Config:
 
             # Output & export options
             "zip": "",
+            "zip_level": 3,
+            "zip_store": False,
             "export": "",
 
             # Listing options
@@ -132,10 +142,11 @@ class Config:
 
     @staticmethod
     def _get_user_config_path() -> Path:
-        """ Return the default user config path for gitree """
-        path = Path(".gitree/config.json")
-        path.parent.mkdir(exist_ok=True, parents=True)
-        return path
+        """ 
+        Return the default user config path for gitree. The parent dir is
+        created only when the config is written (see create_default_config).
+        """
+        return Path(".gitree/config.json")
 
 
     @staticmethod
@@ -162,6 +173,7 @@ class Config:
                 "Config file already exists. This will be overriden.")
 
 
+            config_path.parent.mkdir(exist_ok=True, parents=True)
             with open(config_path, 'w', encoding='utf-8') as f:
                 json.dump(config, f, indent=4, ensure_ascii=False)
                 f.write('\n')
@@ -5,17 +5,190 @@ Code file for housing GitIgnore class
 """
 
 # Default libs
+import os, re
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable
 
-# Dependencies
-import pathspec
-
 # Deps from this project
 from ..objects.app_context import AppContext
 from ..objects.config import Config
 
 
+# Size of the first (usually the only) read of a .gitignore file
+_GITIGNORE_READ_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=1024)
+def _load_gitignore_lines(path_str: str, stamp: tuple[int, int]) -> tuple[tuple[bool, str], ...]:
+    """
+    Read and parse a .gitignore file into (negated, pattern) pairs. Cached, so
+    each .gitignore is parsed only once per version of the file (bounded, to
+    cap memory on huge trees).
+
+    Args:
+        path_str (str): Path of the .gitignore file
+        stamp (tuple[int, int]): Modification time (ns) and size of the file,
+            used for cache invalidation
+
+    Returns:
+        tuple[tuple[bool, str], ...]: The parsed (negated, pattern) pairs
+    """
+    # Read with a raw fd: a single read() covers a typical .gitignore, without
+    # setting up a buffered file object for it
+    try:
+        fd = os.open(path_str, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            raw = os.read(fd, _GITIGNORE_READ_SIZE)
+
+            # Larger files (a short read means end of file) are read in full
+            if len(raw) == _GITIGNORE_READ_SIZE:
+                chunks = [raw]
+                while chunk := os.read(fd, _GITIGNORE_READ_SIZE):
+                    chunks.append(chunk)
+                raw = b"".join(chunks)
+        finally:
+            os.close(fd)
+    except Exception:
+        return ()
+
+    parsed: list[tuple[bool, str]] = []
+    for bline in raw.splitlines():
+
+        # Blank lines and comments are skipped before any decoding
+        bline = bline.strip()
+        if not bline or bline.startswith(b"#"):
+            continue
+
+        line = bline.decode("utf-8", errors="ignore")
+        neg = line.startswith("!")
+        pat = line[1:] if neg else line
+        parsed.append((neg, pat.lstrip("/")))
+
+    return tuple(parsed)
+
+
+class _CombinedSpec:
+    """
+    Matcher for an ordered list of gitignore patterns, compiled into a single
+    regex alternation instead of one regex per pattern.
+
+    Alternatives are tried in reverse pattern order, so the first alternative
+    that matches is the last matching pattern (which decides, as in git).
+    Without negated patterns any match means ignored, so the alternation is
+    compiled without capture groups.
+    """
+
+    # Named groups used by pathspec inside pattern regexes
+    _NAMED_GROUP = re.compile(r"\(\?P<\w+>")
+
+    def __init__(self, patterns: tuple[str, ...]) -> None:
+        """
+        Compile the given gitignore patterns.
+
+        Args:
+            patterns (tuple[str, ...]): The gitignore patterns, in file order
+        """
+        # NOTE: imported here, so runs without any .gitignore never load pathspec
+        import pathspec
+
+        # Only the regex sources of the patterns are needed, so they are
+        # translated without PathSpec.from_lines, which compiles each one of
+        # them before the combined regex is compiled again
+        # NOTE: blank lines and comments translate to (None, None)
+        factory = pathspec.util.lookup_pattern("gitwildmatch")
+        translated = [(regex, include) for regex, include in map(factory.pattern_to_regex, patterns)
+            if include is not None]
+
+        # Group name "_<i>" maps back to the include flag of pattern i
+        # NOTE: None when there are no negations (no groups are needed then)
+        self._includes: dict[str, bool] | None = None
+        alternatives: list[str] = []
+
+        if all(include for _, include in translated):
+            for regex, _ in translated:
+                alternatives.append("(?:" + self._searchable(regex) + ")")
+
+        else:
+            self._includes = {}
+            for i in reversed(range(len(translated))):
+                regex, include = translated[i]
+                self._includes[f"_{i}"] = include
+                alternatives.append(f"(?P<_{i}>{self._searchable(regex)})")
+
+        self._regex = re.compile("|".join(alternatives)) if alternatives else None
+
+
+    @classmethod
+    def _searchable(cls, regex: str) -> str:
+        """
+        Turn a pattern regex into an alternative for the combined regex. The
+        named groups are dropped, and unanchored regexes (e.g. "*/" gives just
+        "/") get a lazy prefix, since pathspec search()es them. The combined
+        regex is match()ed instead, so the first alternative that matches (the
+        last pattern) still wins over the leftmost match position.
+
+        Args:
+            regex (str): The regex source of a single pattern
+
+        Returns:
+            str: The regex source to use as an alternative
+        """
+        regex = cls._NAMED_GROUP.sub("(?:", regex)
+        if regex.startswith("^"):
+            return regex
+
+        # NOTE: dotall only for the prefix, the pattern's own "." must keep
+        # not matching newlines, as in pathspec
+        return "(?s:.*?)(?:" + regex + ")"
+
+
+    def match_file(self, file: str) -> bool:
+        """
+        Check a normalized (POSIX, relative) path against the patterns.
+
+        Args:
+            file (str): The path to check
+
+        Returns:
+            bool: True if the path is ignored, otherwise False
+        """
+        if self._regex is None:
+            return False
+
+        m = self._regex.match(file)
+        if m is None:
+            return False
+        return self._includes is None or self._includes[m.lastgroup]
+
+
+@lru_cache(maxsize=512)
+def _compile_spec(patterns: tuple[str, ...]) -> _CombinedSpec:
+    """
+    Compile gitignore patterns into a combined matcher. Cached, so identical
+    pattern sets are compiled only once (bounded, to cap memory on huge trees).
+
+    Args:
+        patterns (tuple[str, ...]): The gitignore patterns to compile
+
+    Returns:
+        _CombinedSpec: The compiled matcher
+    """
+    return _CombinedSpec(patterns)
+
+
+def _gitignore_stamp(path: Path) -> tuple[int, int]:
+    """ 
+    Return the (mtime in ns, size) of a .gitignore file, or (-1, -1) if it can
+    not be stat'd. The size catches rewrites within the mtime granularity.
+    """
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return -1, -1
+
+
 class GitIgnore:
     """
     Minimal gitignore loader/matcher.
@@ -24,7 +197,8 @@ class GitIgnore:
     - excluded(path) tells if path is ignored by any root's combined patterns.
     """
 
-    def __init__(self, ctx: AppContext, config: Config, gitignore_path: Path) -> None:
+    def __init__(self, ctx: AppContext, config: Config, gitignore_path: Path, 
+        resolved: bool = False) -> None:
         """
         Initialize the gitignore matcher for a single directory by loading patterns
         from the provided .gitignore file.
@@ -33,6 +207,8 @@ class GitIgnore:
             ctx (AppContext): The application context
             config (Config): The application configuration
             gitignore_path (Path): Path to the .gitignore file to load patterns from
+            resolved (bool): Whether gitignore_path is already fully resolved
+                (skips resolving it again)
         """
 
         # Bind app context and config with the object
@@ -44,16 +220,18 @@ class GitIgnore:
         self.gitignore_depth = config.gitignore_depth
 
         # Setup specs for gitignore
-        self._specs: list[tuple[Path, pathspec.PathSpec]]
-        self._load_spec_from_gitignore(gitignore_path)
+        self._specs: list[tuple[str, str, _CombinedSpec]]
+        self._load_spec_from_gitignore(gitignore_path, resolved)
 
 
-    def excluded(self, item_path: Path) -> bool:
+    def excluded(self, item_path: Path, is_dir: bool | None = None) -> bool:
         """
         Determine whether the given path is excluded by the loaded gitignore patterns.
 
         Args:
             item_path (Path): The path to check for exclusion
+            is_dir (bool | None): Whether the path is a dir, if already known
+                (avoids a stat call), otherwise it is checked on disk
 
         Returns:
             bool: True if the path is ignored/excluded, otherwise False
@@ -62,21 +240,66 @@ class GitIgnore:
             return False
 
         p = item_path.resolve(strict=False)
+        return self._excluded_resolved(str(p), p.is_dir() if is_dir is None else is_dir)
 
-        for root, spec in self._specs:
-            try:
-                rel = p.relative_to(root).as_posix()
-            except ValueError:
+
+    def _excluded_resolved(self, p: str, is_dir: bool) -> bool:
+        """
+        Same as excluded(), for an already resolved path with a known type.
+
+        Args:
+            p (str): The resolved path to check for exclusion, as a string
+            is_dir (bool): Whether the path is a dir
+
+        Returns:
+            bool: True if the path is ignored/excluded, otherwise False
+        """
+        for root, root_prefix, spec in self._specs:
+
+            # The relative path is sliced off the string, instead of going
+            # through Path.relative_to for every item
+            if p.startswith(root_prefix):
+                rel = p[len(root_prefix):]
+                if os.sep != "/":
+                    rel = rel.replace(os.sep, "/")
+            elif p == root:
+                rel = "."
+            else:
                 continue
 
             if spec.match_file(rel):
                 return True
-            if p.is_dir() and spec.match_file(rel + "/"):
+            if is_dir and spec.match_file(rel + "/"):
                 return True
 
         return False
 
 
+    def _dir_specs(self, dir_str: str) -> list[tuple[str, _CombinedSpec]]:
+        """
+        Get the specs that apply to the children of a resolved dir, each with
+        the dir's relative path (as a prefix ending with "/") to the spec's root.
+
+        Args:
+            dir_str (str): The resolved dir path, as a string
+
+        Returns:
+            list[tuple[str, _CombinedSpec]]: The (relative prefix, spec) pairs
+        """
+        out: list[tuple[str, _CombinedSpec]] = []
+
+        for root, root_prefix, spec in self._specs:
+            if dir_str == root:
+                out.append(("", spec))
+            elif dir_str.startswith(root_prefix):
+                rel = dir_str[len(root_prefix):]
+                if os.sep != "/":
+                    rel = rel.replace(os.sep, "/")
+                out.append((rel + "/", spec))
+
+        return out
+
+
     def _load_from_roots(self, roots: Iterable[Path]) -> None:
         """
         Load and combine gitignore patterns from all .gitignore files under the given roots.
@@ -89,39 +312,43 @@ class GitIgnore:
 
         for root in self._norm_roots(roots):
             pats = self._collect_patterns(root)
-            self._specs.append((root, pathspec.PathSpec.from_lines("gitwildmatch", pats)))
+            self._add_spec(root, _compile_spec(tuple(pats)))
 
 
-    def _load_spec_from_gitignore(self, gitignore_path: Path) -> None:
+    def _load_spec_from_gitignore(self, gitignore_path: Path, resolved: bool = False) -> None:
         """
         Load gitignore patterns from a single .gitignore file and create a PathSpec
         rooted at its parent directory.
 
         Args:
             gitignore_path (Path): Path to the .gitignore file to load
+            resolved (bool): Whether gitignore_path is already fully resolved
         """
         self._specs = []
 
-        gi = Path(gitignore_path).resolve(strict=False)
+        gi = Path(gitignore_path)
+        if not resolved:
+            gi = gi.resolve(strict=False)
         root = gi.parent
 
-        patterns: list[str] = []
-        try:
-            lines = gi.read_text(encoding="utf-8", errors="ignore").splitlines()
-        except Exception:
-            lines = []
+        patterns = tuple(("!" + pat) if neg else pat
+            for neg, pat in _load_gitignore_lines(str(gi), _gitignore_stamp(gi)))
 
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
+        self._add_spec(root, _compile_spec(patterns))
 
-            neg = line.startswith("!")
-            pat = line[1:] if neg else line
-            pat = pat.lstrip("/")
-            patterns.append(("!" + pat) if neg else pat)
 
-        self._specs.append((root, pathspec.PathSpec.from_lines("gitwildmatch", patterns)))
+    def _add_spec(self, root: Path, spec: _CombinedSpec) -> None:
+        """
+        Add a compiled spec for the given root, keeping the root as a string
+        (and as a prefix ending with a separator) for matching.
+
+        Args:
+            root (Path): The resolved directory the patterns are relative to
+            spec (_CombinedSpec): The compiled patterns
+        """
+        root_str = str(root)
+        root_prefix = root_str if root_str.endswith(os.sep) else root_str + os.sep
+        self._specs.append((root_str, root_prefix, spec))
 
 
     def _norm_roots(self, roots: Iterable[Path]) -> list[Path]:
@@ -184,19 +411,8 @@ class GitIgnore:
             rel_dir = d.relative_to(root).as_posix()
             prefix = "" if rel_dir == "." else rel_dir + "/"
 
-            try:
-                lines = gi.read_text(encoding="utf-8", errors="ignore").splitlines()
-            except Exception:
-                continue
-
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-
-                neg = line.startswith("!")
-                pat = line[1:] if neg else line
-                pat = prefix + pat.lstrip("/")
+            for neg, pat in _load_gitignore_lines(str(gi), _gitignore_stamp(gi)):
+                pat = prefix + pat
                 patterns.append(("!" + pat) if neg else pat)
 
         return patterns
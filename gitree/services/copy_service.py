@@ -6,9 +6,6 @@ Code file for housing CopyService Class.
 Static methods; copies exported output to clipboard
 """
 
-# Dependencies
-import pyperclip
-
 # Deps from this project
 from ..objects.app_context import AppContext
 from ..objects.config import Config
@@ -33,16 +30,12 @@ class CopyService:
             tree_data (dict): The resolved tree dict
         """
 
-        fmt = (getattr(config, "format", "") or "").strip().lower()
-
-        if fmt == "tree":
-            lines = ExportService._export_txt(ctx, config, tree_data)
-
-        elif fmt == "md":
-            lines = ExportService._export_md(ctx, config, tree_data)
+        lines = ExportService.build_lines(ctx, config, tree_data)
+        if lines is None:
+            return
 
-        elif fmt == "json":
-            lines = ExportService._export_json(ctx, config, tree_data)
+        # NOTE: imported here, so that only --copy pays for the clipboard backend
+        import pyperclip
 
         try:
             pyperclip.copy("\n".join(lines))
@@ -56,6 +56,9 @@ class DrawingService:
             tree_data (dict[str, Any]): The resolved tree dict to draw
         """
 
+        # The options read for every line are bound once per draw
+        no_color, files_first = config.no_color, config.files_first
+
         def _p(x: Any) -> str:
             return x.as_posix() if hasattr(x, "as_posix") else str(x)
 
@@ -66,58 +69,85 @@ class DrawingService:
         def _is_dir(node: Any) -> bool:
             return isinstance(node, dict)
 
+        # The emoji prefixes (with their separating space) are resolved once
+        # per draw, and are empty strings when --emoji is not used
+        if config.emoji:
+            file_emoji = FILE_EMOJI + " "
+            dir_emoji, empty_dir_emoji = NORMAL_DIR_EMOJI + " ", EMPTY_DIR_EMOJI + " "
+        else:
+            file_emoji = dir_emoji = empty_dir_emoji = ""
+
         def _emoji_for(node: Any) -> str:
-            if not config.emoji:
-                return ""
             if _is_dir(node):
-                ch = node.get("children", [])
-                return EMPTY_DIR_EMOJI if len(ch) == 0 else NORMAL_DIR_EMOJI
-            return FILE_EMOJI
-
-        def _children_sorted(children: list[Any]) -> list[Any]:
-            if config.files_first:
-                return sorted(children, key=lambda c: (0 if not _is_dir(c) else 1, _name(_p(c.get("self") if _is_dir(c) else c)).lower()))
-            return sorted(children, key=lambda c: (0 if _is_dir(c) else 1, _name(_p(c.get("self") if _is_dir(c) else c)).lower()))
-
-        def _write_line(prefix: str, connector: str, node: Any) -> None:
-            p = _p(node.get("self") if _is_dir(node) else node)
-            label = _name(p)
-            em = _emoji_for(node)
-
-            if config.no_color:
-                color = Color.default
-            elif DrawingService._is_hidden(p):
-                color = Color.grey
-            elif _is_dir(node):
-                color = Color.cyan
-            else:
-                color = Color.default
-
-            if em:
-                ctx.output_buffer.write(f"{prefix}{connector}{em} {color(label)}")
-            else:
-                ctx.output_buffer.write(f"{prefix}{connector}{color(label)}")
+                return dir_emoji if node.get("children") else empty_dir_emoji
+            return file_emoji
+
+        def _children_sorted(children: list[Any]) -> list[tuple[Any, str, str]]:
+            """ Sort the children, along with their path strings and labels """
+
+            # Each child's path string and label are computed in a single pass,
+            # and reused for both sorting and writing its line
+            # NOTE: dirs are sorted first, unless --files-first is used
+            kids: list[tuple[tuple[bool, str], Any, str, str]] = []
+            for c in children:
+                is_dir = _is_dir(c)
+                p = _p(c.get("self") if is_dir else c)
+                label = _name(p)
+                kids.append(((is_dir == files_first, label.lower()), c, p, label))
+
+            kids.sort(key=lambda k: k[0])
+            return [(c, p, label) for _, c, p, label in kids]
+
+        # The line writer is picked once per draw, so the uncolored one never
+        # checks for hidden paths or wraps labels per line
+        if no_color:
+            def _write_line(line_prefix: str, node: Any, p: str, label: str) -> None:
+                write(f"{line_prefix}{_emoji_for(node)}{label}")
+
+        else:
+            def _write_line(line_prefix: str, node: Any, p: str, label: str) -> None:
+                if DrawingService._is_hidden(p):
+                    label = Color.grey(label)
+                elif _is_dir(node):
+                    label = Color.cyan(label)
+
+                write(f"{line_prefix}{_emoji_for(node)}{label}")
+
+        # Lines are collected locally and added to the output buffer in one go
+        lines: list[str] = []
+        write = lines.append
 
         root_path = _p(tree_data.get("self"))
         root_label = _name(root_path)
         root_emoji = _emoji_for(tree_data)
 
-        if root_emoji:
-            ctx.output_buffer.write(f"{root_emoji} "
-                f"{Color.cyan(root_label) if not config.no_color else root_label}")
-        else:
-            ctx.output_buffer.write(f"{Color.cyan(root_label) if not config.no_color else root_label}")
+        write(f"{root_emoji}{Color.cyan(root_label) if not no_color else root_label}")
 
-        def _rec(node: dict[str, Any], prefix: str) -> None:
+        # Depth-first traversal with an explicit stack instead of recursion, so
+        # deep trees cost no Python frames (and can't hit the recursion limit)
+        # NOTE: each entry is (node, path string, label, line prefix, prefix
+        # for the node's children)
+        stack: list[tuple[Any, str, str, str, str]] = []
+
+        def _push_children(node: dict[str, Any], prefix: str) -> None:
             kids = _children_sorted(node.get("children", []))
-            for i, child in enumerate(kids):
-                connector = LAST if i == len(kids) - 1 else BRANCH
-                _write_line(prefix, connector, child)
-                if _is_dir(child):
-                    next_prefix = prefix + (SPACE if connector == LAST else VERT)
-                    _rec(child, next_prefix)
-
-        _rec(tree_data, "")
+            if not kids:
+                return
+
+            # The line and child prefixes only depend on the parent prefix, so
+            # they are built once per dir instead of once per child
+            # NOTE: pushed in reverse, so that the first child is popped first
+            stack.append((*kids[-1], prefix + LAST, prefix + SPACE))
+            branch_prefix, vert_prefix = prefix + BRANCH, prefix + VERT
+            stack.extend((*kid, branch_prefix, vert_prefix) for kid in reversed(kids[:-1]))
+
+        _push_children(tree_data, "")
+        while stack:
+            node, p, label, line_prefix, child_prefix = stack.pop()
+            _write_line(line_prefix, node, p, label)
+            if _is_dir(node):
+                _push_children(node, child_prefix)
+        ctx.output_buffer.extend(lines)
 
 
     @staticmethod
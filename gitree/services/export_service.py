@@ -6,7 +6,9 @@ Code file for housing ExportService Class
 
 # Default libs
 from pathlib import Path
+import json, os
 from typing import Any
+from concurrent.futures import ThreadPoolExecutor
 
 # Deps from this project
 from ..objects.app_context import AppContext
@@ -21,19 +23,10 @@ class ExportService:
         and save it to a file based on config.format.
         """
 
-        fmt = (getattr(config, "format", "") or "").strip().lower()
         output_path = Path(config.export)
 
-        if fmt == "tree":
-            lines = ExportService._export_txt(ctx, config, tree_data)
-
-        elif fmt == "md":
-            lines = ExportService._export_md(ctx, config, tree_data)
-
-        elif fmt == "json":
-            lines = ExportService._export_json(ctx, config, tree_data)
-
-        else:
+        lines = ExportService.build_lines(ctx, config, tree_data)
+        if lines is None:
             return
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -42,6 +35,35 @@ class ExportService:
         ctx.output_buffer.clear()
 
 
+    @staticmethod
+    def build_lines(ctx: AppContext, config: Config, tree_data: dict[str, Any]) -> list[str] | None:
+        """
+        Build the export output (structure followed by file contents) in the
+        format given by config.format. Shared by --export and --copy.
+
+        Args:
+            ctx (AppContext): The application context
+            config (Config): The application configuration
+            tree_data (dict[str, Any]): The resolved tree dict
+
+        Returns:
+            list[str] | None: The output lines, or None for an unknown format
+        """
+
+        fmt = (getattr(config, "format", "") or "").strip().lower()
+
+        if fmt == "tree":
+            return ExportService._export_txt(ctx, config, tree_data)
+
+        elif fmt == "md":
+            return ExportService._export_md(ctx, config, tree_data)
+
+        elif fmt == "json":
+            return ExportService._export_json(ctx, config, tree_data)
+
+        return None
+
+
     @staticmethod
     def _export_txt(ctx: AppContext, config: Config, tree_data: dict[str, Any]) -> list[str]:
         structure = ctx.output_buffer.get_value()
@@ -51,11 +73,12 @@ class ExportService:
         out.append("")
         out.append("==== FILE CONTENTS ====")
 
-        for fp in ExportService._iter_files(tree_data):
-            out.append("")
-            out.append(f"FILE: {fp}")
-            out.append("-" * (6 + len(str(fp))))
-            out.append(ExportService._read_text(fp, config.max_file_size).rstrip("\n"))
+        files = ExportService._iter_files(tree_data)
+        for fp, text in zip(files, ExportService._read_texts(files, config.max_file_size)):
+            # The underline matches the header line, so its length is reused
+            # instead of converting the path to a string a second time
+            header = f"FILE: {fp}"
+            out.extend(("", header, "-" * len(header), text.rstrip("\n")))
 
         return out
 
@@ -70,29 +93,24 @@ class ExportService:
         out.append("## Files")
         out.append("")
 
-        for fp in ExportService._iter_files(tree_data):
-            out.append(f"### File: {fp}")
-            out.append("")
-            out.append("```text")
-            out.append(ExportService._read_text(fp, config.max_file_size).rstrip("\n"))
-            out.append("```")
-            out.append("")
+        files = ExportService._iter_files(tree_data)
+        for fp, text in zip(files, ExportService._read_texts(files, config.max_file_size)):
+            out.extend((f"### File: {fp}", "", "```text", text.rstrip("\n"), "```", ""))
 
         return out
 
 
     @staticmethod
     def _export_json(ctx: AppContext, config: Config, tree_data: dict[str, Any]) -> list[str]:
-        import json
-
         structure = ctx.output_buffer.get_value()
 
+        paths = ExportService._iter_files(tree_data)
         files = [
             {
                 "path": str(fp),
-                "content": ExportService._read_text(fp, config.max_file_size),
+                "content": text,
             }
-            for fp in ExportService._iter_files(tree_data)
+            for fp, text in zip(paths, ExportService._read_texts(paths, config.max_file_size))
         ]
 
         payload = {
@@ -120,18 +138,46 @@ class ExportService:
 
         out: list[Path] = []
 
-        def rec(node: dict[str, Any]) -> None:
-            for child in node.get("children", []):
+        # Depth-first walk with a stack of children iterators instead of
+        # recursion, so files come out in tree order without a frame per dir
+        stack = [iter(tree_data.get("children", []))]
+        while stack:
+            for child in stack[-1]:
                 if isinstance(child, dict):
-                    rec(child)
-                else:
-                    p = child if isinstance(child, Path) else Path(str(child))
-                    out.append(p)
+                    stack.append(iter(child.get("children", [])))
+                    break
+                out.append(child if isinstance(child, Path) else Path(str(child)))
+            else:
+                stack.pop()
 
-        rec(tree_data)
         return out
 
 
+    @staticmethod
+    def _read_texts(paths: list[Path], max_size_mb: float = 1.0) -> list[str]:
+        """
+        Read multiple files as text (see _read_text), keeping the given order.
+
+        Args:
+            paths (list[Path]): The file paths to read
+            max_size_mb (float): Maximum file size in MB (default: 1.0)
+
+        Returns:
+            list[str]: The contents of each file, in the order of paths
+        """
+
+        def read(path: Path) -> str:
+            return ExportService._read_text(path, max_size_mb)
+
+        # File reads are I/O bound (the GIL is released while reading), so
+        # they are done concurrently when there is more than one file
+        if len(paths) > 1:
+            with ThreadPoolExecutor() as pool:
+                return list(pool.map(read, paths))
+
+        return [read(p) for p in paths]
+
+
     @staticmethod
     def _read_text(path: Path, max_size_mb: float = 1.0) -> str:
         """
@@ -147,23 +193,28 @@ class ExportService:
         p = path if isinstance(path, Path) else Path(str(path))
 
         try:
-            # Check file size
-            size_bytes = p.stat().st_size
-            size_mb = size_bytes / (1024 * 1024)
+            # The file is opened once: size check, binary detection and the
+            # read itself all go through the same file object
+            with open(p, 'rb') as f:
 
-            if size_mb > max_size_mb:
-                return f"[file too large: {size_mb:.2f}mb]"
+                # Check file size
+                size_bytes = os.fstat(f.fileno()).st_size
+                size_mb = size_bytes / (1024 * 1024)
 
+                if size_mb > max_size_mb:
+                    return f"[file too large: {size_mb:.2f}mb]"
 
-            # Check if binary (read first 8KB)
-            with open(p, 'rb') as f:
-                chunk = f.read(min(8192, size_bytes))
-                if b'\x00' in chunk:  # Null byte indicates binary
-                    return "[binary file]"
+                data = f.read()
+
+
+            # Check if binary (first 8KB)
+            if b'\x00' in data[:8192]:  # Null byte indicates binary
+                return "[binary file]"
 
 
-            # Read as text
-            return p.read_text(encoding="utf-8", errors="ignore")
+            # Decode as text, with the same newline handling as text mode
+            text = data.decode("utf-8", errors="ignore")
+            return text.replace("\r\n", "\n").replace("\r", "\n")
 
 
         except PermissionError:
@@ -11,6 +11,7 @@ from collections import defaultdict
 
 # Dependencies
 from prompt_toolkit.application import Application
+from prompt_toolkit.data_structures import Point
 from prompt_toolkit.layout import Layout
 from prompt_toolkit.layout.controls import FormattedTextControl
 from prompt_toolkit.layout.containers import Window, HSplit
@@ -24,6 +25,26 @@ from ..objects.config import Config
 
 
 class InteractiveSelectionService:
+
+    # Node types stored in the flat tree's types array
+    _DIR = 0
+    _FILE = 1
+
+    # The fixed instruction bar at the top of the UI (static, built only once)
+    _HEADER: StyleAndTextTuples = [
+        ("class:hint", "↑/↓ "),
+        ("class:hint", "Move"),
+        ("class:hint", "   |   "),
+        ("class:hint", "Space "),
+        ("class:hint", "Toggle"),
+        ("class:hint", "   |   "),
+        ("class:hint", "Enter "),
+        ("class:hint", "Confirm"),
+        ("class:hint", "   |   "),
+        ("class:hint", "Ctrl+C "),
+        ("class:hint", "Exit\n"),
+    ]
+
     @staticmethod
     def run(ctx: AppContext, config: Config, resolved_root: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -44,9 +65,12 @@ class InteractiveSelectionService:
         Returns:
             dict: The updated resolved root dict in the same format as the input
         """
-        from prompt_toolkit.data_structures import Point
-
-        tree: List[dict] = []
+        # The flat tree is kept as parallel arrays (one slot per node)
+        types = bytearray()
+        paths: List[Path] = []
+        indents: List[str] = []
+        labels: List[str] = []
+        checked = bytearray()
         folder_to_files: Dict[int, List[int]] = defaultdict(list)
         folder_to_subdirs: Dict[int, List[int]] = defaultdict(list)
 
@@ -58,19 +82,30 @@ class InteractiveSelectionService:
             resolved_root=resolved_root,
             root=root_path,
             depth=0,
-            tree=tree,
+            types=types,
+            paths=paths,
+            indents=indents,
+            labels=labels,
             folder_to_files=folder_to_files,
             folder_to_subdirs=folder_to_subdirs,
         )
+        checked.extend(bytes(len(types)))
 
-        if not tree:
+        if not types:
             return resolved_root
 
         cursor = 0
 
+        # Rendered fragments (3 per row) are kept between renders, and only the
+        # rows marked dirty (toggled rows, old and new cursor rows) are rebuilt
+        lines: StyleAndTextTuples = [("", "")] * (3 * len(types))
+        dirty: Set[int] = set(range(len(types)))
+        rendered_cursor = cursor
+
         def toggle_dir(index: int, state: bool):
             """
-            Recursively toggle a directory and all its contents.
+            Toggle a directory and all its contents, using an explicit stack
+            instead of recursion.
 
             This updates:
             - The directory itself
@@ -81,59 +116,47 @@ class InteractiveSelectionService:
                 index (int): The index of the directory in the flat UI tree
                 state (bool): The new checked state to apply
             """
-            tree[index]["checked"] = state
-            for f in folder_to_files.get(index, []):
-                tree[f]["checked"] = state
-            for d in folder_to_subdirs.get(index, []):
-                toggle_dir(d, state)
-
-        def render_header() -> StyleAndTextTuples:
+            stack = [index]
+            while stack:
+                i = stack.pop()
+                checked[i] = state
+                dirty.add(i)
+                for f in folder_to_files.get(i, ()):
+                    checked[f] = state
+                    dirty.add(f)
+                stack.extend(folder_to_subdirs.get(i, ()))
+
+        def render_row(i: int) -> None:
             """
-            Render the fixed instruction bar at the top of the UI.
+            Rebuild the rendered fragments of a single row in place.
 
-            Returns:
-                StyleAndTextTuples: The formatted text tuples for the header bar
+            Args:
+                i (int): The index of the row in the flat UI tree
             """
-            return [
-                ("class:hint", "↑/↓ "),
-                ("class:hint", "Move"),
-                ("class:hint", "   |   "),
-                ("class:hint", "Space "),
-                ("class:hint", "Toggle"),
-                ("class:hint", "   |   "),
-                ("class:hint", "Enter "),
-                ("class:hint", "Confirm"),
-                ("class:hint", "   |   "),
-                ("class:hint", "Ctrl+C "),
-                ("class:hint", "Exit\n"),
-            ]
+            if checked[i]:
+                star = ("class:star", "[ ✓ ] ")
+            else:
+                star = ("", "[ ] ")
+
+            cursor_style = "class:cursor" if i == cursor else ""
+
+            lines[3 * i:3 * i + 3] = [(cursor_style, indents[i]), star, (cursor_style, labels[i])]
 
         def render_tree() -> StyleAndTextTuples:
             """
             Render the file/directory tree with indentation and selection markers.
+            Only rows changed since the last render are rebuilt.
 
             Returns:
                 StyleAndTextTuples: The formatted text tuples representing the tree view
             """
-            lines: StyleAndTextTuples = []
-
-            for i, item in enumerate(tree):
-                indent = "  " * item["depth"]
-
-                if item["checked"]:
-                    star = ("class:star", "[ ✓ ] ")
-                else:
-                    star = ("", "[ ] ")
+            nonlocal rendered_cursor
 
-                label = item["path"].split("/")[-1]
-                if item["type"] == "dir":
-                    label += "/"
-
-                cursor_style = "class:cursor" if i == cursor else ""
-
-                lines.append((cursor_style, indent))
-                lines.append(star)
-                lines.append((cursor_style, label + "\n"))
+            dirty.update((rendered_cursor, cursor))
+            for i in dirty:
+                render_row(i)
+            dirty.clear()
+            rendered_cursor = cursor
 
             return lines
 
@@ -166,19 +189,19 @@ class InteractiveSelectionService:
         @kb.add("down")
         def _(e):
             nonlocal cursor
-            cursor = min(len(tree) - 1, cursor + 1)
+            cursor = min(len(types) - 1, cursor + 1)
             _sync_control_cursor()
             e.app.invalidate()
 
         @kb.add(" ")
         def _(e):
-            item = tree[cursor]
-            new_state = not item["checked"]
+            new_state = not checked[cursor]
 
-            if item["type"] == "dir":
+            if types[cursor] == InteractiveSelectionService._DIR:
                 toggle_dir(cursor, new_state)
             else:
-                item["checked"] = new_state
+                checked[cursor] = new_state
+                dirty.add(cursor)
 
             e.app.invalidate()
 
@@ -210,7 +233,7 @@ class InteractiveSelectionService:
             layout=Layout(
                 HSplit([
                     Window(
-                        FormattedTextControl(render_header),
+                        FormattedTextControl(InteractiveSelectionService._HEADER),
                         height=1,
                         dont_extend_height=True,
                     ),
@@ -221,6 +244,9 @@ class InteractiveSelectionService:
             style=style,
             full_screen=True,
             mouse_support=True,
+            # Coalesce invalidate() calls from held-down keys into at most one
+            # redraw per frame (~60 fps) instead of one redraw per key event
+            min_redraw_interval=1 / 60,
         )
 
         app.layout.focus(tree_window)
@@ -228,9 +254,9 @@ class InteractiveSelectionService:
         app.run()
 
         selected_files = {
-            (root_path / item["path"])
-            for item in tree
-            if item["type"] == "file" and item["checked"]
+            paths[i]
+            for i in range(len(types))
+            if types[i] == InteractiveSelectionService._FILE and checked[i]
         }
 
         return InteractiveSelectionService._filter_resolved_root(resolved_root, selected_files)
@@ -241,7 +267,10 @@ class InteractiveSelectionService:
         resolved_root: Dict[str, Any],
         root: Path,
         depth: int,
-        tree: List[dict],
+        types: bytearray,
+        paths: List[Path],
+        indents: List[str],
+        labels: List[str],
         folder_to_files: Dict[int, List[int]],
         folder_to_subdirs: Dict[int, List[int]],
     ) -> None:
@@ -256,7 +285,10 @@ class InteractiveSelectionService:
             resolved_root (dict): The resolved root dict with "self" and "children"
             root (Path): The root path used to compute relative display paths
             depth (int): Current depth level for indentation
-            tree (list[dict]): The flat render-order list to populate
+            types (bytearray): Node types (_DIR or _FILE) in render order, to populate
+            paths (list[Path]): Node paths in render order, to populate
+            indents (list[str]): Precomputed node indentation strings, to populate
+            labels (list[str]): Precomputed node display labels, to populate
             folder_to_files (dict[int, list[int]]): Directory index -> file indices mapping
             folder_to_subdirs (dict[int, list[int]]): Directory index -> directory indices mapping
         """
@@ -265,40 +297,38 @@ class InteractiveSelectionService:
         if not isinstance(dir_path, Path):
             dir_path = Path(str(dir_path))
 
-        folder_index = len(tree)
+        folder_index = len(types)
         rel_dir = dir_path.relative_to(root).as_posix() or "(root)"
 
-        tree.append({
-            "type": "dir",
-            "path": rel_dir,
-            "depth": depth,
-            "checked": False,
-        })
+        types.append(InteractiveSelectionService._DIR)
+        paths.append(dir_path)
+        indents.append("  " * depth)
+        labels.append((dir_path.name if depth else rel_dir) + "/\n")
 
         children = resolved_root.get("children", [])
         for child in children:
             if isinstance(child, dict):
-                child_index = len(tree)
+                child_index = len(types)
                 folder_to_subdirs[folder_index].append(child_index)
                 InteractiveSelectionService._build_tree(
                     resolved_root=child,
                     root=root,
                     depth=depth + 1,
-                    tree=tree,
+                    types=types,
+                    paths=paths,
+                    indents=indents,
+                    labels=labels,
                     folder_to_files=folder_to_files,
                     folder_to_subdirs=folder_to_subdirs,
                 )
             else:
                 child_path = child if isinstance(child, Path) else Path(str(child))
-                rel_path = child_path.relative_to(root).as_posix()
-
-                file_index = len(tree)
-                tree.append({
-                    "type": "file",
-                    "path": rel_path,
-                    "depth": depth + 1,
-                    "checked": False,
-                })
+
+                file_index = len(types)
+                types.append(InteractiveSelectionService._FILE)
+                paths.append(child_path)
+                indents.append("  " * (depth + 1))
+                labels.append(child_path.name + "\n")
                 folder_to_files[folder_index].append(file_index)
 
 
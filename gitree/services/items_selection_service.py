@@ -5,9 +5,10 @@ Code file for the ItemsSelectionService class.
 """
 
 # default libs
-from typing import Any
+from typing import Any, Collection
 import os, glob
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Deps from this project
 from ..objects.app_context import AppContext
@@ -32,12 +33,20 @@ class ItemsSelectionService:
 
         # Resolve all the root paths first
         # NOTE: the root path is appended at the end of the list of resolved paths
-        resolved_root_paths = ItemsSelectionService._resolve_given_paths(
-            ctx, config, config.paths)
-        resolved_include_paths = ItemsSelectionService._resolve_given_paths(
-            ctx, config, config.include)
-        resolved_exclude_paths = ItemsSelectionService._resolve_given_paths(
-            ctx, config, config.exclude)
+        given_paths = (config.paths, config.include, config.exclude)
+
+        def resolve(attr: list[str]) -> list[Path]:
+            return ItemsSelectionService._resolve_given_paths(ctx, config, attr)
+
+        # Recursive globs are I/O bound (scandir releases the GIL), so expand them
+        # concurrently when more than one of the lists has glob patterns
+        if sum(any(map(ItemsSelectionService._isglob, attr)) for attr in given_paths) > 1:
+            with ThreadPoolExecutor(max_workers=len(given_paths)) as pool:
+                resolved_given_paths = list(pool.map(resolve, given_paths))
+        else:
+            resolved_given_paths = [resolve(attr) for attr in given_paths]
+
+        resolved_root_paths, resolved_include_paths, resolved_exclude_paths = resolved_given_paths
         
 
         # Safety check to avoid crashes on no paths found
@@ -48,11 +57,16 @@ class ItemsSelectionService:
 
         # Start from the parent dir and keep adding items recursively
         # includes resolving hidden_files, gitignore, include and exclude
+        # NOTE: the path collections are frozensets so that _isunder can check
+        # membership in O(1) per ancestor
         resolved_items, _ = ItemsSelectionService._resolve_items_rec(ctx, config, 
-            resolved_paths=resolved_root_paths, curr_depth=0, curr_entries=1,
+            resolved_paths=frozenset(resolved_root_paths), curr_depth=0, curr_entries=1,
+            resolved_dirs=ItemsSelectionService._ancestor_paths(resolved_root_paths),
             gitignore_matcher=GitIgnoreMatcher(),
-            curr_dir=resolved_root_paths[-1], include_paths=resolved_include_paths[:-1], 
-            exclude_paths=resolved_exclude_paths[:-1])
+            given_paths=ItemsSelectionService._given_dir_paths(config),
+            curr_dir=resolved_root_paths[-1], real_dir=True,
+            include_paths=frozenset(resolved_include_paths[:-1]), 
+            exclude_paths=frozenset(resolved_exclude_paths[:-1]))
 
         return resolved_items
 
@@ -70,12 +84,14 @@ class ItemsSelectionService:
             list[Path]: A list of paths to be added, with the parent appended at the end
         """
 
-        calculated_paths: list[Path] = []
-        base_path = Path(os.getcwd())          # This is needed to resolve paths later
+        # NOTE: a dict is used as an ordered set, so repeated matches are dropped
+        # Paths are kept as plain strings (os.path) until they are returned
+        calculated_paths: dict[str, None] = {}
+        base_path = os.getcwd()          # This is needed to resolve paths later
 
 
         if not attr:        # Safety check
-            return [base_path]
+            return [Path(base_path)]
 
 
         # Separately resolve for glob patterns and proper paths
@@ -86,38 +102,43 @@ class ItemsSelectionService:
             if ItemsSelectionService._isglob(path_str):
 
                 # Include underlying and hidden items as well
-                matched_paths = glob.glob(path_str, recursive=True, include_hidden=True)
+                # Stream the matches instead of materializing the whole list first
+                matched = False
+                for match_str in glob.iglob(path_str, recursive=True, include_hidden=True):
+                    calculated_paths[os.path.realpath(match_str)] = None
+                    matched = True
 
                 # If the glob could not be resolved
-                if not matched_paths:
+                if not matched:
                     ctx.logger.log(Logger.WARNING, 
                         f"No matches found for glob pattern '{path_str}'")
-                    
-                # Append the matches to the calculated paths
-                for path_str in matched_paths:
-                    calculated_paths.append(Path(path_str).resolve(strict=False))
                 
             else:
-                path = Path(path_str)
-                resolved_path = (base_path / path).resolve(strict=False)
-                calculated_paths.append(resolved_path)
+                resolved_path = os.path.realpath(os.path.join(base_path, path_str))
+                calculated_paths[resolved_path] = None
 
 
         # Replace the placeholder for the parent path in the calculated paths
-        if calculated_paths:
-            calculated_paths.append(Path(os.path.commonpath(calculated_paths)))
+        paths = [Path(p) for p in calculated_paths]
+        if paths:
+            paths.append(Path(os.path.commonpath(calculated_paths)))
 
-        return calculated_paths
+        return paths
     
 
     @staticmethod
     def _resolve_items_rec(ctx: AppContext, config: Config, *,
-        resolved_paths: list[Path], curr_dir: Path, curr_depth: int, curr_entries: int,
-        include_paths: list[Path], exclude_paths: list[Path], 
+        resolved_paths: frozenset[Path], resolved_dirs: frozenset[Path],
+        curr_dir: Path, real_dir: bool, curr_depth: int, curr_entries: int,
+        include_paths: frozenset[Path], exclude_paths: frozenset[Path], 
+        given_paths: frozenset[Path], 
         gitignore_matcher: GitIgnoreMatcher) -> tuple[dict[str, Any], int]:
         """
         Resolve the paths recursively.
 
+        NOTE: real_dir tells if curr_dir is already fully resolved (no symlinks
+        on the way from the root), so its children do not need to be resolved
+
         Returns:
             dict[str, Any]: A dict of the resolved root and a list of children paths
             int: current entries to keep track of the number of entries during recursion
@@ -133,22 +154,71 @@ class ItemsSelectionService:
             return resolved_root, curr_entries
         
 
+        # Nothing more can be added once --max-entries is reached, so the dir
+        # is not even listed (the items loop would stop at its first item)
+        if not config.no_max_entries and curr_entries >= config.max_entries:
+            return resolved_root, curr_entries
+
+
         # Get the dir's children, sorted order, and files first
-        children_to_add = sorted(curr_dir.iterdir(), key=lambda p: (p.is_dir(), p.name.lower()))
+        # NOTE: os.scandir caches the entry types, so no extra stat per child
+        with os.scandir(curr_dir) as it:
+            children_to_add = sorted(it, key=lambda e: (e.is_dir(), e.name.lower()))
 
 
         # Setup gitignore object for this dir (if there is a .gitignore)
-        if curr_depth <= config.gitignore_depth and (curr_dir / ".gitignore").is_file():
+        # NOTE: looked up in the listing above, so no stat probe is needed, and
+        # a plain .gitignore in a real dir is already a resolved path
+        # With --no-gitignore it would only be parsed to be disabled, so it is
+        # not loaded at all. The gitignore only applies under this dir, so it
+        # is removed from the matcher again once the dir is done (see below)
+        gitignore_entry = None
+        if not config.no_gitignore and curr_depth <= config.gitignore_depth:
+            gitignore_entry = next(
+                (e for e in children_to_add if e.name == ".gitignore" and e.is_file()), None)
+        has_gitignore = gitignore_entry is not None
+        if has_gitignore:
             gitignore_matcher.add_gitignore(
-                GitIgnore(ctx, config, gitignore_path=(curr_dir / ".gitignore")))
+                GitIgnore(ctx, config, gitignore_path=(curr_dir / ".gitignore"),
+                    resolved=real_dir and not gitignore_entry.is_symlink()))
+
+
+        # Hoisted out of the items loop: the union of resolved and include paths
+        # is built once per dir, and the exclude check is skipped when unused
+        # The config options read for every item are bound to locals as well
+        covered_paths = resolved_paths | include_paths if include_paths else resolved_paths
+        has_excludes = bool(exclude_paths)
+
+        # An item's ancestors are this dir and the dir's ancestors, so the
+        # ancestor walks of _isunder are done once for the dir, and each item
+        # only has to check itself
+        dir_covered = ItemsSelectionService._isunder(curr_dir, covered_paths)
+        dir_excluded = has_excludes and ItemsSelectionService._isunder(curr_dir, exclude_paths)
+        dir_path_given = ItemsSelectionService._isunder(curr_dir, given_paths)
+        skip_hidden, no_files = not config.hidden_items, config.no_files
+        within_gitignore_depth = curr_depth <= config.gitignore_depth
+        max_items = None if config.no_max_items else config.max_items
+        max_entries = None if config.no_max_entries else config.max_entries
+
+        # Gitignore state for the dir's children is set up once per dir, so the
+        # per-item check only matches the child's name
+        # NOTE: not used under a followed symlink, those items are resolved
+        excluded_name = gitignore_matcher.dir_matcher(curr_dir) if real_dir else None
 
 
         items_added = 0
         # Now traverse the dir and add items
-        for item_path in children_to_add:
+        for entry in children_to_add:
+
+            # Skip hidden items (unless --hidden-items is used) straight from the
+            # entry name, before any per-item work is done for them
+            if skip_hidden and entry.name.startswith("."): continue
+
+            item_path = Path(entry.path)
+            is_file, is_dir = entry.is_file(), entry.is_dir()
 
             # If --no-files is used, then skip files
-            if item_path.is_file() and config.no_files: continue
+            if is_file and no_files: continue
 
 
             # NOTE: this whole if-elif block bellow basically solves the problem of
@@ -157,37 +227,37 @@ class ItemsSelectionService:
 
 
             # If current dir path is not given
-            if not ItemsSelectionService._dir_path_under_given_paths(config, curr_dir):
+            if not dir_path_given:
                 
                 # If it is a file and it is not is resolved paths
                 # and if the current dir we are working for, is not given in paths
-                if (item_path.is_file() and not item_path in resolved_paths):
+                if (is_file and not item_path in resolved_paths):
                     continue
 
                 # If it is a dir and it has no file under it that is in resolved_paths
-                elif (item_path.is_dir() and 
-                    not any(ItemsSelectionService._isunder(t, [item_path]) for t in resolved_paths)):
+                # NOTE: resolved_dirs holds every resolved path and all of their
+                # ancestors, so this is a single lookup instead of a scan
+                elif (is_dir and item_path not in resolved_dirs):
                     continue
 
 
             # If reached --max-items or --max-entries, then exit
             # NOTE: This is ok for now, but needs to be corrected later
-            if (not config.no_max_items and items_added >= config.max_items or
-                not config.no_max_entries and curr_entries >= config.max_entries): 
+            if (max_items is not None and items_added >= max_items or
+                max_entries is not None and curr_entries >= max_entries): 
                 break
 
 
             # NOTE: DANGEROUS IF-STATEMENT AHEAD!
 
-            # Check if it is not a hidden file/dir or hidden-items flag is used
             # Check if the item is in resolved paths, or in include paths
             # Check if the item is defined by an include pattern
             # Or if there is a gitignore that says it is excluded
-            if ((config.hidden_items or not ItemsSelectionService._ishidden(item_path)) and
-                ItemsSelectionService._isunder(item_path, resolved_paths + include_paths) and 
-                not ItemsSelectionService._isunder(item_path, exclude_paths) and 
-                (not curr_depth > config.gitignore_depth and 
-                not gitignore_matcher.excluded(item_path))):  
+            if ((dir_covered or item_path in covered_paths) and 
+                not (dir_excluded or has_excludes and item_path in exclude_paths) and 
+                (within_gitignore_depth and 
+                not (excluded_name(entry.name, is_dir) if real_dir and not entry.is_symlink()
+                    else gitignore_matcher.excluded(item_path, is_dir)))):  
 
 
                     items_added += 1
@@ -195,34 +265,58 @@ class ItemsSelectionService:
                     
                     
                     # If the item is a file then append directly, else resolve for it
-                    if item_path.is_file():
+                    if is_file:
                         resolved_root["children"].append(item_path)
 
                     else:      
                         resolved_dir, curr_entries = ItemsSelectionService._resolve_items_rec(
-                            ctx, config, resolved_paths=resolved_paths, 
+                            ctx, config, resolved_paths=resolved_paths, resolved_dirs=resolved_dirs,
                             curr_entries=curr_entries, curr_dir=item_path, include_paths=include_paths, gitignore_matcher=gitignore_matcher,
-                            exclude_paths=exclude_paths, curr_depth=curr_depth+1)
+                            real_dir=real_dir and not entry.is_symlink(),
+                            exclude_paths=exclude_paths, given_paths=given_paths, curr_depth=curr_depth+1)
                             
                         resolved_root["children"].append(resolved_dir)
                         
 
+        if has_gitignore:
+            gitignore_matcher.pop_gitignore()
+
         return resolved_root, curr_entries
 
 
     @staticmethod
-    def _dir_path_under_given_paths(config: Config, dir_path: Path) -> bool:
+    def _ancestor_paths(paths: list[Path]) -> frozenset[Path]:
+        """
+        Collect the given paths along with all of their ancestors. Computed once
+        per run, so checking whether a dir leads to any of the paths is O(1).
+        """
+
+        ancestors: set[Path] = set(paths)
+
+        for path in paths:
+            for parent in path.parents:
+                # Parents of an already collected ancestor are collected as well
+                if parent in ancestors:
+                    break
+                ancestors.add(parent)
+
+        return frozenset(ancestors)
+
+
+    @staticmethod
+    def _given_dir_paths(config: Config) -> frozenset[Path]:
         """ 
-        Check if the dir path was given by the user
+        Resolve the (non-glob) paths given by the user. Computed once per run,
+        then checked against each dir with _isunder.
         """
 
-        given_paths: list[Path] = []
+        given_paths: set[Path] = set()
 
         for path_str in config.paths:
             if not ItemsSelectionService._isglob(path_str): 
-                given_paths.append(Path(path_str).resolve(strict=False))
+                given_paths.add(Path(path_str).resolve(strict=False))
 
-        return ItemsSelectionService._isunder(dir_path, given_paths)
+        return frozenset(given_paths)
     
 
     @staticmethod
@@ -231,10 +325,10 @@ class ItemsSelectionService:
     
 
     @staticmethod
-    def _ishidden(item_path: Path) -> bool:
-        return item_path.name.startswith(".")
-    
-    
-    @staticmethod
-    def _isunder(path: Path, parents: list[Path]) -> bool:
-        return any(path == p or path.is_relative_to(p) for p in parents)
+    def _isunder(path: Path, parents: Collection[Path]) -> bool:
+        """
+        Check if the path is one of the parents or lies under one of them.
+        Walks up the path's ancestors, so it costs O(depth) membership checks
+        (O(1) each when parents is a set) instead of comparing every parent.
+        """
+        return path in parents or any(p in parents for p in path.parents)
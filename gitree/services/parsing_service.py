@@ -6,13 +6,13 @@ correction, and processing for argparse.
 """
 
 # Default libs
-import argparse
+import argparse, sys
 
 # Dependencies
 from pathlib import Path
 
 # Imports from this project
-from ..utilities.functions_utility import max_items_int, max_entries_int
+from ..utilities.functions_utility import max_items_int, max_entries_int, zip_level_int
 from ..objects.config import Config
 from ..objects.app_context import AppContext
 
@@ -34,6 +34,13 @@ class ParsingService:
             Config: Configuration object to be used in-place of args
         """
 
+        # General options like --version need none of the other args, so they
+        # are checked with a minimal parser before the full one is built
+        meta_args = ParsingService._parse_general_options(ctx)
+        if meta_args is not None:
+            ctx.logger.log(ctx.logger.DEBUG, f"Parsed arguments: {meta_args}")
+            return Config(ctx, meta_args)
+
         ap = argparse.ArgumentParser(
             description="Print a directory tree (respects .gitignore).",
             formatter_class=argparse.RawTextHelpFormatter,
@@ -64,6 +71,32 @@ class ParsingService:
         return ParsingService._fix_contradicting_args(ctx, config)
     
 
+    @staticmethod
+    def _parse_general_options(ctx: AppContext) -> argparse.Namespace | None:
+        """
+        Parse only the general options, skipping the construction of the full
+        parser when one of them (--version, --config-user) is used.
+
+        Returns:
+            argparse.Namespace | None: The parsed general options if one was
+                used, otherwise None (the full parser is needed)
+        """
+
+        # Help output needs the full parser
+        if "-h" in sys.argv[1:] or "--help" in sys.argv[1:]:
+            return None
+
+        # NOTE: abbreviations are disabled here so that only exact flags take
+        # the shortcut, the full parser still resolves abbreviated ones
+        ap = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+        ParsingService._add_general_options(ctx, ap)
+        args, _ = ap.parse_known_args()
+
+        if getattr(args, "version", False) or getattr(args, "config_user", False):
+            return args
+        return None
+
+
     @staticmethod
     def _fix_contradicting_args(ctx: AppContext, config: Config) -> Config:
         """
@@ -194,6 +227,14 @@ class ParsingService:
         io.add_argument("-z", "--zip", 
             default=argparse.SUPPRESS, 
             help="Create a zip archive of the given directory respecting gitignore rules.")
+
+        io.add_argument("--zip-level", type=zip_level_int,
+            default=argparse.SUPPRESS, metavar="LEVEL", dest="zip_level",
+            help="Deflate compression level (0-9) for --zip (default: 3)")
+
+        io.add_argument("--zip-store", action="store_true",
+            default=argparse.SUPPRESS,
+            help="Store files in the --zip archive without compressing them")
         
         io.add_argument("--export", 
             default=argparse.SUPPRESS, 
@@ -9,11 +9,15 @@ Static methods; zips the resolved tree into the configured output path
 # Default libs
 from typing import Any
 from pathlib import Path
-import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import argparse, io, os, shutil, stat, time, zipfile
 
 # Deps from this project
 from ..objects.app_context import AppContext
 from ..objects.config import Config
+from ..utilities.functions_utility import zip_level_int
+from ..utilities.logging_utility import Logger
 
 
 class ZippingService:
@@ -21,6 +25,36 @@ class ZippingService:
     Static class for zipping the resolved tree (dict format) into a zip file.
     """
 
+    # Suffixes of formats that are already compressed, deflating these again
+    # costs CPU time for (next to) no size gain, so they are stored as-is
+    _STORED_SUFFIXES = frozenset({
+        ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar", ".zst", ".whl", ".jar",
+        ".png", ".jpg", ".jpeg", ".gif", ".webp", ".ico",
+        ".mp3", ".mp4", ".mkv", ".mov", ".webm", ".ogg", ".flac",
+        ".pdf", ".docx", ".xlsx", ".pptx", ".woff", ".woff2",
+    })
+
+    # Read-ahead settings: how many files are read by worker threads ahead of
+    # the writer, and the largest file that is read fully into memory for it
+    # NOTE: at most _PREFETCH_WINDOW * _PREFETCH_MAX_SIZE (16 MiB) of contents
+    # is held at once, larger files are streamed by the writer instead
+    _PREFETCH_WORKERS = 4
+    _PREFETCH_WINDOW = 16
+    _PREFETCH_MAX_SIZE = 1024 * 1024
+
+    # Chunk size for streaming the larger files into the archive (zipfile's
+    # own write() uses 8 KiB, which means many small read/deflate rounds)
+    _STREAM_CHUNK_SIZE = 256 * 1024
+
+    # Deflate level used when the configured zip_level is invalid
+    _DEFAULT_COMPRESS_LEVEL = 3
+
+    # Write buffer of the output archive, so an entry's data goes out in one
+    # write() instead of one per 8 KiB (the default buffer size)
+    # NOTE: this only helps entries over 8 KiB (compressed), since zipfile
+    # seeks back to rewrite each local header, and a seek flushes the buffer
+    _OUTPUT_BUFFER_SIZE = 1024 * 1024
+
     @staticmethod
     def run(ctx: AppContext, config: Config, tree_data: dict[str, Any]) -> None:
         """
@@ -41,19 +75,213 @@ class ZippingService:
         root = tree_data.get("self")
         root = root if isinstance(root, Path) else Path(str(root))
 
+        # The root is resolved once, arcnames are then sliced off file paths
+        root_str = os.path.realpath(root)
+        root_prefix = root_str if root_str.endswith(os.sep) else root_str + os.sep
+
+        # With --no-files the tree only holds dirs, so the archive just gets an
+        # entry per dir, without the thread pool and file pipeline below
+        if config.no_files:
+            with (ZippingService._open_output(zip_path) as out,
+                zipfile.ZipFile(out, "w") as zf):
+                for dir_path in ZippingService._collect_dirs(tree_data):
+
+                    # The entry gets the dir's own mode and mtime, like the
+                    # file entries do (zf.mkdir would write 0o777 and 1980-01-01)
+                    try:
+                        zinfo = ZippingService._zipinfo(
+                            ZippingService._arcname(root_prefix, dir_path) + "/", os.stat(dir_path))
+                        zf.writestr(zinfo, b"")
+                    except Exception:
+                        continue
+            return
+
         files = ZippingService._collect_files(tree_data)
 
-        with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        # Level 3 deflates several times faster than zlib's default 6, for a
+        # slightly larger archive (--zip-level raises it, --zip-store skips it)
+        if config.zip_store:
+            compression, compresslevel = zipfile.ZIP_STORED, None
+        else:
+            compression = zipfile.ZIP_DEFLATED
+            compresslevel = ZippingService._compress_level(ctx, config.zip_level)
+
+        # Worker threads read files ahead (I/O, the GIL is released) while the
+        # main thread compresses and writes them in order
+        # NOTE: the window, with the per-file size cap, bounds how much file
+        # content is held in memory at once
+        # NOTE: the context managers exit in reverse, so the pool is drained and
+        # the archive is finished before the output file is flushed and closed
+        with (ZippingService._open_output(zip_path) as out,
+            zipfile.ZipFile(out, "w", compression=compression, compresslevel=compresslevel) as zf,
+            ThreadPoolExecutor(max_workers=ZippingService._PREFETCH_WORKERS) as pool):
+
+            # The archive's (device, inode) is taken once from the open file
+            out_st = os.fstat(out.fileno())
+            out_id = (out_st.st_dev, out_st.st_ino)
+
+            pending: deque[Future] = deque()
+            out_name = zip_path.name
             for fp in files:
-                try:
-                    arcname = ZippingService._arcname(root, fp)
-                    zf.write(fp, arcname=arcname)
-                except Exception:
+
+                # Never add the archive being written to itself (it is in the tree
+                # when it is rewritten inside the zipped dir)
+                # NOTE: only a file with the archive's name can be it, so all the
+                # other files are skipped without a stat
+                if os.path.basename(fp) == out_name and ZippingService._file_id(fp) == out_id:
                     continue
 
+                pending.append(pool.submit(ZippingService._read_entry, root_prefix, fp))
+                if len(pending) >= ZippingService._PREFETCH_WINDOW:
+                    ZippingService._write_entry(zf, pending.popleft())
+
+            while pending:
+                ZippingService._write_entry(zf, pending.popleft())
+
+
+    @staticmethod
+    def _compress_level(ctx: AppContext, level: Any) -> int:
+        """
+        Validate the configured deflate level. It is checked on the CLI, but
+        not when it comes from config.json, and a bad level would otherwise
+        make every entry fail to compress.
+
+        Args:
+            ctx (AppContext): The application context
+            level (Any): The configured zip_level value
+
+        Returns:
+            int: The level to use, the default one if the value is invalid
+        """
+        try:
+            return zip_level_int(str(level))
+        except (ValueError, argparse.ArgumentTypeError):
+            ctx.logger.log(Logger.ERROR, f"Invalid zip_level {level!r} (must be an"
+                f" integer from 0 to 9), using {ZippingService._DEFAULT_COMPRESS_LEVEL}")
+            return ZippingService._DEFAULT_COMPRESS_LEVEL
+
 
     @staticmethod
-    def _collect_files(tree_data: dict[str, Any]) -> list[Path]:
+    def _open_output(zip_path: Path) -> io.BufferedWriter:
+        """
+        Open the output archive for writing, with a large write buffer over an
+        unbuffered file.
+
+        Args:
+            zip_path (Path): Path of the zip archive to create
+
+        Returns:
+            io.BufferedWriter: The opened file, to be passed to zipfile.ZipFile
+        """
+        raw = open(zip_path, "wb", buffering=0)
+
+        # Hint the kernel that the file is written front to back (POSIX only)
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(raw.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+
+        return io.BufferedWriter(raw, buffer_size=ZippingService._OUTPUT_BUFFER_SIZE)
+
+
+    @staticmethod
+    def _file_id(path: str) -> tuple[int, int] | None:
+        """ Return the (device, inode) of a file, or None if it can not be stat'd """
+        try:
+            st = os.stat(path)
+            return st.st_dev, st.st_ino
+        except OSError:
+            return None
+
+
+    @staticmethod
+    def _read_entry(root_prefix: str, fp: str) -> tuple[str, zipfile.ZipInfo, bytes | None]:
+        """
+        Prepare a file for the archive: its zip entry info, and its contents if
+        it is small enough to be read ahead into memory. Run by worker threads.
+
+        Args:
+            root_prefix (str): Resolved root directory, ending with a separator
+            fp (str): File path to add to the archive
+
+        Returns:
+            tuple[str, zipfile.ZipInfo, bytes | None]: The file path, its entry
+                info, and its contents (None if it is to be streamed instead)
+        """
+        # NOTE: the entry info is built from an fstat of the opened file, instead
+        # of ZipInfo.from_file, which stats the path before it is opened again
+        with open(fp, "rb") as f:
+            st = os.fstat(f.fileno())
+            zinfo = ZippingService._zipinfo(ZippingService._arcname(root_prefix, fp), st)
+
+            data = None
+            if st.st_size <= ZippingService._PREFETCH_MAX_SIZE:
+                data = f.read()
+
+        return fp, zinfo, data
+
+
+    @staticmethod
+    def _zipinfo(arcname: str, st: os.stat_result) -> zipfile.ZipInfo:
+        """
+        Build the zip entry info of a file or dir from its stat result, the
+        same way zipfile.ZipInfo.from_file does.
+
+        Args:
+            arcname (str): Name of the file inside the archive (ending with "/"
+                for a dir)
+            st (os.stat_result): Stat result of the file or dir
+
+        Returns:
+            zipfile.ZipInfo: The entry info, without a compression type set
+        """
+        zinfo = zipfile.ZipInfo(arcname, time.localtime(st.st_mtime)[:6])
+        zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+        if stat.S_ISDIR(st.st_mode):
+            zinfo.external_attr |= 0x10     # MS-DOS directory flag
+        else:
+            zinfo.file_size = st.st_size
+        return zinfo
+
+
+    @staticmethod
+    def _write_entry(zf: zipfile.ZipFile, future: Future) -> None:
+        """
+        Write a file prepared by _read_entry into the archive. Files that could
+        not be read are skipped.
+
+        Args:
+            zf (zipfile.ZipFile): The archive being written
+            future (Future): The pending result of _read_entry for the file
+        """
+        try:
+            fp, zinfo, data = future.result()
+
+            if os.path.splitext(fp)[1].lower() in ZippingService._STORED_SUFFIXES:
+                compress_type = zipfile.ZIP_STORED
+            else:
+                compress_type = zf.compression
+
+            zinfo.compress_type = compress_type
+
+            # Large files are streamed from disk in big chunks
+            # NOTE: a ZipInfo passed in does not take the archive's compresslevel,
+            # and zf.open() has no parameter for it, so it is set on the entry
+            # (public as compress_level from 3.13)
+            if data is None:
+                zinfo._compresslevel = zf.compresslevel
+                with open(fp, "rb") as src, zf.open(zinfo, "w") as dst:
+                    shutil.copyfileobj(src, dst, ZippingService._STREAM_CHUNK_SIZE)
+            else:
+                zf.writestr(zinfo, data, compresslevel=zf.compresslevel)
+
+        except Exception:
+            return
+
+
+    @staticmethod
+    def _collect_files(tree_data: dict[str, Any]) -> list[str]:
         """
         Collect all file paths from the resolved tree dict.
 
@@ -61,38 +289,70 @@ class ZippingService:
             tree_data (dict[str, Any]): A resolved tree dict with "self" and "children"
 
         Returns:
-            list[Path]: A list of file Paths found in the tree
+            list[str]: A list of the file paths found in the tree, as strings
+        """
+        # NOTE: plain strings, the zip path only needs os.path and open() on them
+        out: list[str] = []
+
+        # Depth-first walk with a stack of children iterators instead of
+        # recursion, so files come out in tree order without a frame per dir
+        stack = [iter(tree_data.get("children", []))]
+        while stack:
+            for child in stack[-1]:
+                if isinstance(child, dict):
+                    stack.append(iter(child.get("children", [])))
+                    break
+                out.append(str(child))
+            else:
+                stack.pop()
+
+        return out
+
+
+    @staticmethod
+    def _collect_dirs(tree_data: dict[str, Any]) -> list[str]:
+        """
+        Collect all dir paths (except the root itself) from the resolved tree dict.
+
+        Args:
+            tree_data (dict[str, Any]): A resolved tree dict with "self" and "children"
+
+        Returns:
+            list[str]: A list of the dir paths found in the tree, as strings
         """
-        out: list[Path] = []
+        out: list[str] = []
 
-        def rec(node: dict[str, Any]) -> None:
-            children = node.get("children", [])
-            for child in children:
+        stack = [iter(tree_data.get("children", []))]
+        while stack:
+            for child in stack[-1]:
                 if isinstance(child, dict):
-                    rec(child)
-                else:
-                    p = child if isinstance(child, Path) else Path(str(child))
-                    out.append(p)
+                    out.append(str(child.get("self")))
+                    stack.append(iter(child.get("children", [])))
+                    break
+            else:
+                stack.pop()
 
-        rec(tree_data)
         return out
 
 
     @staticmethod
-    def _arcname(root: Path, file_path: Path) -> str:
+    def _arcname(root_prefix: str, file_path: str) -> str:
         """
         Compute the archive name for a file so it is stored relative to the root.
+        Files that resolve outside of the root are stored by their name only.
 
         Args:
-            root (Path): Root directory of the tree
-            file_path (Path): File path to add to the archive
+            root_prefix (str): Resolved root directory, ending with a separator
+            file_path (str): File path to add to the archive
 
         Returns:
             str: Relative path inside the zip archive (POSIX separators)
         """
-        try:
-            rel = file_path.resolve(strict=False).relative_to(root.resolve(strict=False))
-        except Exception:
-            rel = Path(file_path.name)
+        # NOTE: string slicing on the resolved path, instead of building Paths
+        # with relative_to() and as_posix() for every file
+        resolved = os.path.realpath(file_path)
+        if not resolved.startswith(root_prefix):
+            return os.path.basename(file_path)
 
-        return rel.as_posix()
+        rel = resolved[len(root_prefix):]
+        return rel if os.sep == "/" else rel.replace(os.sep, "/")
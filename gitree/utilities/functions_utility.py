@@ -46,3 +46,23 @@ def max_entries_int(v: str) -> int:
         raise argparse.ArgumentTypeError(
             "--max-entries must be >= 1 and <=10000")
     return n
+
+
+def zip_level_int(v: str) -> int:
+    """
+    Validate and convert zip-level argument to integer.
+
+    Args:
+        v (str): String value from command line argument
+
+    Returns:
+        int: Validated integer between 0 and 9
+
+    Raises:
+        argparse.ArgumentTypeError: If value is outside valid range
+    """
+    n = int(v)
+    if n < 0 or n > 9:
+        raise argparse.ArgumentTypeError(
+            "--zip-level must be >= 0 and <=9 (or use --zip-store)")
+    return n
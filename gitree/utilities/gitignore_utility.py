@@ -6,6 +6,7 @@ Code file for housing GitIgnoreMatcher.
 
 # Default libs
 from pathlib import Path
+from typing import Callable
 
 # Deps from this project
 from ..objects.gitignore import GitIgnore
@@ -22,10 +23,60 @@ class GitIgnoreMatcher:
     def add_gitignore(self, gitignore: GitIgnore):
         self.gitignores.append(gitignore)
 
+
+    def pop_gitignore(self) -> GitIgnore:
+        # Gitignores are added and removed in walk order (a stack of the
+        # current dir's ancestors), so the last one added is removed
+        return self.gitignores.pop()
+
     
-    def excluded(self, item_path: Path) -> bool:
+    def excluded(self, item_path: Path, is_dir: bool | None = None) -> bool:
+        # Resolve (and stat, if the type is unknown) once per item, not per gitignore
+        if not any(gitignore.enabled for gitignore in self.gitignores):
+            return False
+
+        p = item_path.resolve(strict=False)
+        if is_dir is None:
+            is_dir = p.is_dir()
+
+        p_str = str(p)
         for gitignore in self.gitignores:
-            if gitignore.excluded(item_path):
+            if gitignore.enabled and gitignore._excluded_resolved(p_str, is_dir):
                 return True
             
         return False
+
+
+    def dir_matcher(self, dir_path: Path) -> Callable[[str, bool], bool]:
+        """
+        Get a matcher for the children of a resolved dir, taking a child's name
+        and whether it is a dir. The specs that apply to the dir and their
+        relative prefixes are worked out once, so each child only costs a string
+        concat and the regex matches.
+
+        NOTE: only valid for real (non-symlink) children of a resolved dir,
+        others must go through excluded()
+        """
+        if not self.gitignores:
+            return GitIgnoreMatcher._excluded_none
+
+        dir_str = str(dir_path)
+        specs = [pair for gitignore in self.gitignores if gitignore.enabled
+            for pair in gitignore._dir_specs(dir_str)]
+        if not specs:
+            return GitIgnoreMatcher._excluded_none
+
+        def excluded_name(name: str, is_dir: bool) -> bool:
+            for rel_dir, spec in specs:
+                rel = rel_dir + name
+                if spec.match_file(rel) or is_dir and spec.match_file(rel + "/"):
+                    return True
+            return False
+
+        return excluded_name
+
+
+    @staticmethod
+    def _excluded_none(name: str, is_dir: bool) -> bool:
+        # Shared matcher for dirs that no gitignore applies to
+        return False
@@ -4,6 +4,10 @@
 Code file for housing Logger and OutputBuffer classes.
 """
 
+# Default libs
+import sys
+
+# Deps from this project
 from ..utilities.color_utility import Color
 
 
@@ -152,6 +156,16 @@ class OutputBuffer(Logger):
         super().log(level=None, message=message)
 
 
+    def extend(self, messages: list[str]) -> None:
+        """
+        Write multiple messages to the logger's output storage at once.
+
+        Args:
+            messages: The messages to write, in order
+        """
+        self._messages.extend(messages)
+
+
     def get_value(self) -> list[str]:
         """
         Get the entire contents of the output buffer as a list of strings.
@@ -171,6 +185,6 @@ class OutputBuffer(Logger):
         if super().empty():
             return      # Do not print anything
 
-        for message in self.get_value():
-            print(message)
+        # One write for the whole buffer instead of a print() per line
+        sys.stdout.write("\n".join(self._messages) + "\n")
     
\ No newline at end of file
@@ -0,0 +1,51 @@
+# tests/test_gitignore_matching.py
+import unittest
+
+import pathspec
+
+from gitree.objects.gitignore import _compile_spec
+
+
+class TestGitIgnoreMatching(unittest.TestCase):
+    """
+    Tests that the combined gitignore matcher ignores the same paths as
+    pathspec's own gitwildmatch PathSpec, including:
+        - Unanchored directory patterns ("*/", "**/")
+        - Negations, where the last matching pattern decides ("!*/", "!keep.log")
+        - Anchored and recursive patterns ("/x", "a/**")
+    """
+
+    PATTERN_SETS = [
+        ("*/",),
+        ("!*/",),
+        ("**/",),
+        ("build/",),
+        ("/x",),
+        ("a/**",),
+        ("*.log", "!keep.log"),
+        ("*", "!*/"),
+        ("*/", "!keep.log"),
+        ("**/", "!a/"),
+        ("a/**", "!*/", "*.log"),
+        ("build/", "/x", "!x"),
+    ]
+
+    PATHS = [
+        "x", "a", "build", "keep.log", "err.log",
+        "a/x", "a/b", "x/a", "build/x", "a/build",
+        "a/keep.log", "b/err.log", "a/b/c", "a/b/keep.log",
+    ]
+
+
+    def test_matches_pathspec(self):
+        """
+        Verify that files and dirs ("dir/" paths) are matched the same
+        way pathspec matches them, for every pattern set.
+        """
+        for patterns in self.PATTERN_SETS:
+            spec = pathspec.PathSpec.from_lines("gitwildmatch", patterns)
+            combined = _compile_spec(patterns)
+
+            for path in self.PATHS + [p + "/" for p in self.PATHS]:
+                with self.subTest(patterns=patterns, path=path):
+                    self.assertEqual(combined.match_file(path), spec.match_file(path))
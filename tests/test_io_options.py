@@ -7,7 +7,7 @@ from tests.base_setup import BaseCLISetup
 class TestIOFlags(BaseCLISetup):
     """
     Tests I/O-related CLI flags, including:
-        - Creating zip archives using --zip
+        - Creating zip archives using --zip (and --zip-level, --zip-store)
         - Exporting tree output to a file using --export
     """
 
@@ -34,6 +34,72 @@ class TestIOFlags(BaseCLISetup):
             self.assertIn("file.txt", names)
 
 
+    def test_zip_store(self):
+        """
+        Verify that the --zip-store flag stores the files in the zip
+        archive without compressing them.
+        """
+        file_path = self.root / "file.txt"
+        file_path.write_text("hello " * 100, encoding="utf-8")
+
+        zip_path = self.root / "output.zip"
+
+        result = self.run_gitree("--zip", zip_path.name, "--zip-store")
+
+        self.assertEqual(result.returncode, 0, msg=result.stderr)
+
+        with zipfile.ZipFile(zip_path) as zf:
+            info = zf.getinfo("file.txt")
+            self.assertEqual(info.compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(zf.read("file.txt"), b"hello " * 100)
+
+
+    def test_zip_level(self):
+        """
+        Verify that the --zip-level flag is used for the zip archive,
+        and that out-of-range levels are rejected.
+        """
+        file_path = self.root / "file.txt"
+        file_path.write_text("hello " * 1000, encoding="utf-8")
+
+        fast_path = self.root / "fast.zip"
+        small_path = self.root / "small.zip"
+
+        result = self.run_gitree("--zip", fast_path.name, "--zip-level", "0")
+        self.assertEqual(result.returncode, 0, msg=result.stderr)
+
+        result = self.run_gitree("--zip", small_path.name, "--zip-level", "9")
+        self.assertEqual(result.returncode, 0, msg=result.stderr)
+
+        with zipfile.ZipFile(fast_path) as fast, zipfile.ZipFile(small_path) as small:
+            self.assertEqual(fast.read("file.txt"), b"hello " * 1000)
+            self.assertEqual(small.read("file.txt"), b"hello " * 1000)
+            self.assertLess(small.getinfo("file.txt").compress_size,
+                fast.getinfo("file.txt").compress_size)
+
+        result = self.run_gitree("--zip", "bad.zip", "--zip-level", "12")
+        self.assertNotEqual(result.returncode, 0)
+
+
+    def test_zip_no_files(self):
+        """
+        Verify that --zip with --no-files creates an archive holding
+        only the directory entries.
+        """
+        (self.root / "sub").mkdir()
+        (self.root / "sub" / "file.txt").write_text("hello", encoding="utf-8")
+
+        zip_path = self.root / "output.zip"
+
+        result = self.run_gitree("--zip", zip_path.name, "--no-files")
+
+        self.assertEqual(result.returncode, 0, msg=result.stderr)
+
+        with zipfile.ZipFile(zip_path) as zf:
+            self.assertEqual(zf.namelist(), ["sub/"])
+            self.assertTrue(zf.getinfo("sub/").is_dir())
+
+
     def test_export(self):
         """
         Verify that the --export flag writes the directory tree output
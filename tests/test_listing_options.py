@@ -11,6 +11,7 @@ class TestListingFlags(BaseCLISetup):
         - Showing hidden files & folders (--hidden-items)
         - Ordering files before folders (--files-first)
         - Inclusion overrides that bypass .gitignore (--include)
+        - Directory patterns in .gitignore ("*/")
     """
 
     @staticmethod
@@ -121,3 +122,20 @@ class TestListingFlags(BaseCLISetup):
         (self.root / "error.log").write_text("log")
         (self.root / "data.json").write_text("{}")
 
+
+    def test_gitignore_dir_pattern(self):
+        """
+        Verify that a "*/" .gitignore pattern ignores every directory,
+        and only the top-level files are listed.
+        """
+        (self.root / ".gitignore").write_text("*/\n")
+        (self.root / "a.py").write_text("python")
+        (self.root / "sub").mkdir()
+        (self.root / "sub" / "b.py").write_text("python")
+
+        result = self.run_gitree("--no-color")
+
+        self.assertEqual(result.returncode, 0, msg=result.stderr)
+        self.assertIn("a.py", result.stdout)
+        self.assertNotIn("sub", result.stdout)
+        self.assertNotIn("b.py", result.stdout)